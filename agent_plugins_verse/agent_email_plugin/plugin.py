@@ -1,20 +1,137 @@
 # email_plugin.py
+import asyncio
+import atexit
+import contextlib
+import functools
 import os
+import queue
 import smtplib
+from email import policy
 from email.mime.text import MIMEText
 from semantic_kernel.functions import kernel_function
 from dotenv import load_dotenv
 load_dotenv()
 
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465
+
+# Gmail allows up to 15 simultaneous connections; stay well under it.
+SMTP_POOL_SIZE = 5
+
+
+class _SMTPPool:
+    """
+    Pool of keep-alive, authenticated SMTP_SSL connections.
+
+    Opening a fresh SMTP_SSL session per send pays the TLS handshake plus
+    AUTH LOGIN round trips every time, which dominates latency for small
+    bodies. The pool leases an already-authenticated connection per send
+    and returns it afterwards, reconnecting transparently when the server
+    has dropped the session.
+    """
+
+    def __init__(self, sender, app_password, size=SMTP_POOL_SIZE):
+        self.sender = sender
+        self.app_password = app_password
+        self._pool = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._pool.put(None)  # placeholders; connect lazily on first lease
+        atexit.register(self.close_all)
+
+    def _connect(self):
+        smtp = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT)
+        smtp.login(self.sender, self.app_password)
+        return smtp
+
+    @contextlib.contextmanager
+    def acquire(self):
+        """
+        Leases a healthy connection from the pool as a context manager.
+        """
+        smtp = self._pool.get()
+        try:
+            if smtp is not None:
+                try:
+                    smtp.noop()
+                except (smtplib.SMTPServerDisconnected, smtplib.SMTPException, OSError):
+                    with contextlib.suppress(Exception):
+                        smtp.close()
+                    smtp = None
+            if smtp is None:
+                smtp = self._connect()
+            yield smtp
+        except Exception:
+            # Connection state is unknown after a failure; drop it and
+            # put a placeholder back so the pool keeps its capacity.
+            with contextlib.suppress(Exception):
+                smtp.close()
+            smtp = None
+            raise
+        finally:
+            self._pool.put(smtp)
+
+    def close_all(self):
+        """
+        Sends QUIT on every pooled connection. Registered via atexit.
+        """
+        while True:
+            try:
+                smtp = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            if smtp is not None:
+                with contextlib.suppress(Exception):
+                    smtp.quit()
+
+
+@functools.lru_cache(maxsize=256)
+def _render_message(sender: str, subject: str, body: str) -> bytes:
+    """
+    Renders the MIME envelope minus the To: header, cached per content.
+
+    Bulk sends reuse the same subject/body across recipients, so the
+    MIMEText construction and header/CRLF encoding are paid once; only
+    the To: line is prepended per recipient.
+    """
+    msg = MIMEText(body)
+    msg['Subject'] = subject
+    msg['From'] = sender
+    # policy.SMTP renders with CRLF line endings. The default compat32
+    # policy emits bare LF, and smtplib only runs _fix_eols on str
+    # payloads — Gmail rejects bare-LF messages (550 5.6.11).
+    return msg.as_bytes(policy=policy.SMTP)
+
+
 class EmailPlugin:
+    _pool = None
+
     def __init__(self):
         self.sender = os.getenv("SENDER_EMAIL")
         self.app_password = os.getenv("GMAIL_PASSWORD")
+        # Share one pool across plugin instances (agents are re-created
+        # per request but the process-wide connections stay warm).
+        if EmailPlugin._pool is None:
+            EmailPlugin._pool = _SMTPPool(self.sender, self.app_password)
+        self._pool = EmailPlugin._pool
 
     @kernel_function(
         name="send_email",
         description="Send an email to a specific recipient using Gmail SMTP."
     )
+    async def send_email_async(
+        self,
+        subject: str,
+        body: str,
+        recipient: str = "pmadhan0006@gmail.com"
+    ) -> str:
+        """
+        Sends an email without blocking the event loop.
+
+        The SMTP round trips run in a worker thread via asyncio.to_thread,
+        so the agent loop keeps streaming while the send is in flight.
+        """
+        return await asyncio.to_thread(self.send_email, subject, body, recipient)
+
     def send_email(
         self,
         subject: str,
@@ -33,14 +150,11 @@ class EmailPlugin:
             str: Success or failure message
         """
         try:
-            msg = MIMEText(body)
-            msg['Subject'] = subject
-            msg['From'] = self.sender
-            msg['To'] = recipient
-
-            with smtplib.SMTP_SSL("smtp.gmail.com", 465) as smtp:
-                smtp.login(self.sender, self.app_password)
-                smtp.sendmail(self.sender, [recipient], msg.as_string())
+            payload = b"To: " + recipient.encode("ascii") + b"\r\n" + \
+                _render_message(self.sender, subject, body)
+
+            with self._pool.acquire() as smtp:
+                smtp.sendmail(self.sender, [recipient], payload)
 
             return f"✅ Email sent to {recipient} with subject '{subject}'."
         except Exception as e:
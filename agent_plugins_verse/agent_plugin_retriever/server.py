@@ -9,10 +9,15 @@ MCP Server to expose a semantic retrieval tool: search_tickets over an SSE trans
 """
 
 import os
+import functools
 import json
-import traceback
+import logging
+import threading
+import time
+from collections import deque
 from typing import List, Dict, Optional
 
+import numpy as np
 from mcp.server.fastmcp import FastMCP
 
 # Embedding clients
@@ -31,6 +36,25 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+log = logging.getLogger(__name__)
+
+# Rate limit for error logging: formatting a traceback per failure is
+# expensive under a failure storm, so emit at most one per second.
+_LOG_INTERVAL_SECONDS = 1.0
+_last_exception_log = 0.0
+
+
+def _log_exception(message: str, *args) -> None:
+    """
+    Logs an exception with traceback, sampled to one record per second.
+    """
+    global _last_exception_log
+    now = time.monotonic()
+    if now - _last_exception_log >= _LOG_INTERVAL_SECONDS:
+        _last_exception_log = now
+        log.exception(message, *args)
+
+
 # ---- MCP server config ----
 NAME = "Ticket Retriever Tool"
 HOST = "0.0.0.0"
@@ -45,65 +69,265 @@ DOC_TABLE = os.getenv("TIDB_DOC_TABLE", "tickets_data_set")
 VECTOR_DIM = int(os.getenv("VECTOR_DIM", "384"))  # set to the dimension you used (384/1536/etc)
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")  # optional - required for Gemini
 
+# Local embedder backend: set EMBED_BACKEND=onnx (requires onnxruntime) to
+# run an int8-quantized export of MiniLM — dynamic int8 roughly doubles
+# CPU throughput vs FP32 with negligible recall loss at dim 384.
+EMBED_BACKEND = os.getenv("EMBED_BACKEND", "torch")
+EMBED_MODEL_FILE = os.getenv("EMBED_MODEL_FILE", "model_qint8_avx512_vnni.onnx")
+
 # ---- Clients initialization ----
-# TiDB Vector client (used for query). Do not drop existing table in production.
-vs_client = TiDBVectorClient(
-    table_name=VECTOR_TABLE,
-    connection_string=TIDB_CONN,
-    vector_dimension=VECTOR_DIM,
-    drop_existing_table=False,
-)
+# Both clients open TCP connections, so they are created lazily on first
+# use instead of at import — orchestrator startup no longer blocks on a
+# TiDB handshake, and no connection is wasted if retrieval never runs.
+
+@functools.lru_cache(maxsize=1)
+def _get_vs_client() -> TiDBVectorClient:
+    """
+    TiDB Vector client (used for query). Do not drop existing table in production.
+    """
+    return TiDBVectorClient(
+        table_name=VECTOR_TABLE,
+        connection_string=TIDB_CONN,
+        vector_dimension=VECTOR_DIM,
+        drop_existing_table=False,
+    )
+
 
-# SQL engine for fetching original documents
-sql_engine = create_engine(TIDB_CONN)
+@functools.lru_cache(maxsize=1)
+def _get_sql_engine():
+    """
+    SQL engine for fetching original documents, with a shared connection pool.
+    """
+    return create_engine(TIDB_CONN, pool_size=10, pool_pre_ping=True, pool_recycle=1800)
 
 # Local embedder fallback (lazy init)
 _local_embedder = None
 
+# Shared Gemini client + request config: constructing a Client per call
+# re-initializes the HTTP session and credential handling every query,
+# so build both once and reuse the pooled connection.
+_gemini_client = genai.Client(api_key=GOOGLE_API_KEY) if (GOOGLE_API_KEY and genai is not None) else None
+_gemini_embed_config = (
+    EmbedContentConfig(task_type="RETRIEVAL_DOCUMENT", output_dimensionality=VECTOR_DIM)
+    if genai is not None else None
+)
+
+# ---- Query cache (exact + semantic) ----
+# Repeated and paraphrased queries are common in conversational retrieval;
+# caching skips both the embedding round trip and the TiDB ANN scan.
+CACHE_TTL_SECONDS = 600  # invalidation window for writes to ticket_embeddings
+CACHE_MAX_ENTRIES = 2048
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+
+class _QueryCache:
+    """
+    Two-tier result cache for search_tickets.
+
+    Tier 1 is an exact-match lookup keyed by (query, k, filters). Tier 2
+    matches the query embedding against cached embeddings by cosine
+    similarity, so near-duplicate phrasings reuse the stored result.
+    Entries expire after CACHE_TTL_SECONDS and are evicted FIFO.
+    """
+
+    def __init__(self, maxlen: int = CACHE_MAX_ENTRIES):
+        # each entry: (key, scope, unit-norm embedding or None, result, expires_at)
+        self._entries = deque(maxlen=maxlen)
+        self._exact = {}
 
-def _local_embed(texts: List[str]) -> List[List[float]]:
+    @staticmethod
+    def make_key(query: str, k: int, filters: Optional[Dict]):
+        scope = (k, json.dumps(filters, sort_keys=True) if filters else None)
+        return (query, scope), scope
+
+    def get_exact(self, key):
+        entry = self._exact.get(key)
+        if entry is None:
+            return None
+        if entry[4] < time.monotonic():
+            self._exact.pop(key, None)
+            return None
+        return entry[3]
+
+    def get_semantic(self, scope, q_emb):
+        now = time.monotonic()
+        candidates = [e for e in self._entries
+                      if e[1] == scope and e[2] is not None and e[4] >= now]
+        if not candidates:
+            return None
+        sims = np.vstack([e[2] for e in candidates]) @ q_emb
+        best = int(np.argmax(sims))
+        if sims[best] >= SEMANTIC_CACHE_THRESHOLD:
+            return candidates[best][3]
+        return None
+
+    def put(self, key, scope, q_emb, result):
+        if len(self._entries) == self._entries.maxlen:
+            evicted = self._entries[0]
+            self._exact.pop(evicted[0], None)
+        entry = (key, scope, q_emb, result, time.monotonic() + CACHE_TTL_SECONDS)
+        self._entries.append(entry)
+        self._exact[key] = entry
+
+
+_query_cache = _QueryCache()
+
+
+def _normalize(emb) -> np.ndarray:
+    vec = np.asarray(emb, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else vec
+
+
+def _local_embed(texts: List[str]) -> np.ndarray:
     global _local_embedder
     if _local_embedder is None:
         # small, fast model — adjust to your preference
-        _local_embedder = SentenceTransformer("all-MiniLM-L6-v2")
-    embs = _local_embedder.encode(texts)
-    # sentence_transformers returns numpy arrays -> convert to lists
-    return [e.tolist() for e in embs]
+        try:
+            import torch
+            torch.set_num_threads(os.cpu_count() or 1)
+        except ImportError:
+            pass
+        if EMBED_BACKEND == "onnx":
+            _local_embedder = SentenceTransformer(
+                "all-MiniLM-L6-v2",
+                backend="onnx",
+                model_kwargs={"file_name": EMBED_MODEL_FILE},
+            )
+        else:
+            _local_embedder = SentenceTransformer("all-MiniLM-L6-v2")
+    embs = _local_embedder.encode(
+        texts,
+        batch_size=64,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+    return embs
 
 
-def _gemini_embed(texts: List[str], dim: int = VECTOR_DIM) -> List[List[float]]:
+def _gemini_embed(texts: List[str], dim: int = VECTOR_DIM) -> np.ndarray:
     """
     Generate embeddings via Gemini (google-genai).
     Requires GOOGLE_API_KEY env var set and google-genai installed.
     """
-    if genai is None:
+    if _gemini_client is None:
         raise RuntimeError("google-genai SDK not available (pip install google-genai)")
 
-    client = genai.Client(api_key=GOOGLE_API_KEY)
-    resp = client.models.embed_content(
+    config = _gemini_embed_config if dim == VECTOR_DIM else \
+        EmbedContentConfig(task_type="RETRIEVAL_DOCUMENT", output_dimensionality=dim)
+    resp = _gemini_client.models.embed_content(
         model="gemini-embedding-001",
         contents=texts,
-        config=EmbedContentConfig(task_type="RETRIEVAL_DOCUMENT", output_dimensionality=dim),
+        config=config,
     )
-    return [emb.values for emb in resp.embeddings]
+    return np.asarray([emb.values for emb in resp.embeddings], dtype=np.float32)
+
+
+class _EmbedBatcher:
+    """
+    Coalesces concurrent embedding requests into one Gemini batch call.
 
+    The embed_content endpoint accepts batches, but search_tickets only
+    ever submits one query at a time. When several tool calls arrive
+    concurrently, the first caller becomes the leader: it waits a short
+    window, drains everything queued in the meantime, issues a single
+    batched request, and fans the rows back out to the waiting callers.
+    """
 
-def embed_texts(texts: List[str]) -> List[List[float]]:
+    def __init__(self, window_seconds: float = 0.005):
+        self._window = window_seconds
+        self._lock = threading.Lock()
+        self._pending = []  # (texts, event, slot) with slot = [result, error]
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        done = threading.Event()
+        slot = [None, None]
+        with self._lock:
+            leader = not self._pending
+            self._pending.append((texts, done, slot))
+
+        if leader:
+            time.sleep(self._window)
+            with self._lock:
+                batch, self._pending = self._pending, []
+            flat = [t for req_texts, _, _ in batch for t in req_texts]
+            try:
+                embeddings = _gemini_embed(flat)
+            except Exception as exc:
+                for _, event, req_slot in batch:
+                    req_slot[1] = exc
+                    event.set()
+            else:
+                offset = 0
+                for req_texts, event, req_slot in batch:
+                    req_slot[0] = embeddings[offset:offset + len(req_texts)]
+                    offset += len(req_texts)
+                    event.set()
+        else:
+            done.wait()
+
+        if slot[1] is not None:
+            raise slot[1]
+        return slot[0]
+
+
+_embed_batcher = _EmbedBatcher()
+
+
+def embed_texts(texts: List[str]) -> np.ndarray:
     """
     Wrapper that prefers Gemini if API key is present; otherwise uses local fallback.
+    Returns one float32 row per input text; downstream consumers (vector
+    query, cache) take the ndarray rows directly, so no per-row Python
+    float lists are materialized.
     """
     if GOOGLE_API_KEY and genai is not None:
         try:
-            return _gemini_embed(texts)
+            return _embed_batcher.embed(texts)
         except Exception as e:
             # If remote fails, fallback
-            print("Gemini embedding failed, falling back to local model:", e)
-            traceback.print_exc()
+            _log_exception("Gemini embedding failed, falling back to local model")
             return _local_embed(texts)
     else:
         return _local_embed(texts)
 
 
+def _search_tickets_batch(queries: List[str], k: int, filters: Optional[Dict]) -> List:
+    """
+    Shared retrieval path for single and batch searches.
+
+    All cache misses are embedded in ONE embed_texts call, so a batch of
+    sub-questions costs a single embedding round trip. The ANN lookups
+    still run per vector because TiDBVectorClient exposes no multi-query
+    API, but they reuse the client's pooled connection.
+    """
+    results = [None] * len(queries)
+    misses = []  # (index, cache key, cache scope)
+
+    for idx, query in enumerate(queries):
+        cache_key, cache_scope = _QueryCache.make_key(query, k, filters)
+        cached = _query_cache.get_exact(cache_key)
+        if cached is not None:
+            results[idx] = cached
+        else:
+            misses.append((idx, cache_key, cache_scope))
+
+    if misses:
+        embeddings = embed_texts([queries[idx] for idx, _, _ in misses])
+        for (idx, cache_key, cache_scope), q_emb in zip(misses, embeddings):
+            q_unit = _normalize(q_emb)
+            cached = _query_cache.get_semantic(cache_scope, q_unit)
+            if cached is not None:
+                results[idx] = cached
+                continue
+            result = _get_vs_client().query(q_emb, k=k, filter=filters if filters else None)
+            _query_cache.put(cache_key, cache_scope, q_unit, result)
+            results[idx] = result
+
+    return results
+
+
 class TicketRetrieverPlugin:
     """
     MCP plugin exposing ticket retrieval functionality.
@@ -123,32 +347,33 @@ class TicketRetrieverPlugin:
 
         """
         try:
-            # 1) Embed the query text
-            q_emb = embed_texts([query])[0]
-
-            # 2) Query the vector store
-            result = vs_client.query(q_emb, k=k, filter=filters if filters else None)
-
-            # 3) Process each match in the result
-            # out = []
-            # for match in result.matches:
-            #     meta = match.metadata or {}
-            #     out.append({
-            #         "ticket_uid": str(match.id),
-            #         "score": float(getattr(match, "distance", 0.0)),
-            #         "subject": meta.get("subject") or meta.get("document"),
-            #         "body": meta.get("body"),
-            #         "answer": meta.get("answer"),
-            #         "meta": meta,
-            #     })
-
-            return result
+            return _search_tickets_batch([query], k, filters)[0]
 
         except Exception as exc:
-            print("search_tickets error:", exc)
-            traceback.print_exc()
+            _log_exception("search_tickets error")
             return [{"error": str(exc)}]
 
+    @staticmethod
+    @mcp.tool()
+    def search_tickets_batch(queries: List[str], k: int = 5, filters: Optional[Dict] = None) :
+        """
+        Search similar tickets for several queries in one call.
+
+        Args:
+            queries (list[str]): Natural-language query strings, e.g. the
+                sub-questions of a decomposed ticket.
+            k (int, optional): Number of top results to return per query. Defaults to 5.
+            filters (dict, optional): Metadata-based filters to narrow down results server-side.
+
+        Returns one result set per query, in input order.
+        """
+        try:
+            return _search_tickets_batch(list(queries), k, filters)
+
+        except Exception as exc:
+            _log_exception("search_tickets_batch error")
+            return [[{"error": str(exc)}] for _ in queries]
+
     @staticmethod
     def display_runtime_info():
         """Prints out the server’s host and port information to the console."""
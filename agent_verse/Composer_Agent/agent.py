@@ -1,6 +1,7 @@
 """
 Defines the CalculatorAgent to perform and validate mathematical calculations.
 """
+import asyncio
 from datetime import datetime
 from semantic_kernel.functions import KernelArguments
 from semantic_kernel import Kernel
@@ -25,19 +26,22 @@ class ComposerAgent:
         Extracts the total number of tokens consumed from an LLM response object.
         """
 
-        if result and hasattr(result, "metadata"):
-            usage_info = result.metadata['usage']
-            if hasattr(usage_info, "total_tokens"):
-                total_tokens = usage_info.total_tokens
-                return total_tokens
-            if hasattr(usage_info, "prompt_tokens") and hasattr(usage_info, "completion_tokens"):
-                total_tokens = usage_info.prompt_tokens + usage_info.completion_tokens
-                return total_tokens
-
-            log.debug("The 'usage' object does not have a 'total_tokens' or 'prompt_tokens' or 'completion_tokens' attribute.")
-        else:
+        metadata = getattr(result, "metadata", None)
+        if not metadata:
             log.debug("The result list is empty or missing the 'usage' attribute.")
+            return 0
 
+        usage_info = metadata.get("usage") if isinstance(metadata, dict) else getattr(metadata, "usage", None)
+        total_tokens = getattr(usage_info, "total_tokens", None)
+        if total_tokens is not None:
+            return total_tokens
+
+        prompt_tokens = getattr(usage_info, "prompt_tokens", None)
+        completion_tokens = getattr(usage_info, "completion_tokens", None)
+        if prompt_tokens is not None and completion_tokens is not None:
+            return prompt_tokens + completion_tokens
+
+        log.debug("The 'usage' object does not have a 'total_tokens' or 'prompt_tokens' or 'completion_tokens' attribute.")
         return 0
 
     async def get_agent(self):
@@ -89,7 +93,9 @@ class ComposerAgent:
         # while development keep in mind this is a while true loop.
         # ensure you implement the right logic for exit and only for testing
         while True:
-            user_input = input("Enter something (type 'q' or 'quit' to exit): ")
+            # Read stdin in a worker thread so the event loop keeps
+            # servicing plugin/MCP I/O while waiting on the user.
+            user_input = await asyncio.to_thread(input, "Enter something (type 'q' or 'quit' to exit): ")
             if user_input.lower() in ['q', 'quit']:
                 print("Exiting...")
                 break
@@ -114,6 +120,4 @@ class ComposerAgent:
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(ComposerAgent().run())
@@ -3,6 +3,7 @@ Provides PromptFactory for loading prompt templates from text and DOCX files,
 and assembling them into a single prompt string for agents.
 """
 
+import functools
 import os
 from docx import Document
 
@@ -12,22 +13,29 @@ class PromptFactory:
     Factory for loading and assembling agent prompts.
     """
 
-    def read_docx_file(self, file_path):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def read_docx_file(file_path):
         """
         Extracts text from a DOCX file using python-docx.
+        Cached per path: the zipfile + XML parse is paid once per process.
         """
         try:
             doc = Document(file_path)
-            paragraphs = [para.text for para in doc.paragraphs]
-            return "\n".join(paragraphs)
+            # Generator into join: no intermediate list, and empty
+            # paragraphs are dropped so they don't cost prompt tokens.
+            return "\n".join(para.text for para in doc.paragraphs if para.text)
         except Exception as e:
             print(f"Error reading DOCX file {file_path}: {e}")
             return ""
 
-    def load_prompt_content(self, file_name):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def load_prompt_content(file_name):
         """
         Reads the file content from the 'prompts' folder based on file extension.
-        Supports '.txt' and '.docx' files.
+        Supports '.txt' and '.docx' files. Prompt files are immutable at
+        runtime, so the content is cached per file name.
         """
         if not file_name or file_name.strip() == "":
             raise Exception(f" {file_name} Not found")
@@ -46,15 +54,19 @@ class PromptFactory:
                 print(f"Error reading text file {file_path}: {e}")
                 return ""
         elif extension == ".docx":
-            return self.read_docx_file(file_path)
+            return PromptFactory.read_docx_file(file_path)
         else:
             print(f"Unsupported file type: {extension}")
             return ""
 
-    def get_agent_prompt(self):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_agent_prompt():
         """
         Loads base, business, and knowledge prompt templates from the prompt_library
         folder and concatenates them into a single full prompt string.
+        The assembled prompt is cached, so re-creating agents skips the
+        filesystem reads entirely.
         """
 
         current_file_directory = os.path.dirname(os.path.abspath(__file__))
@@ -65,9 +77,9 @@ class PromptFactory:
         system_knowledge_file = os.path.join(current_file_directory, prompt_library_folder, "SystemKnowledgePrompt.txt")
 
         # Load content from each file.
-        base_prompt_content = self.load_prompt_content(system_base_file)
-        business_prompt_content = self.load_prompt_content(system_business_file)
-        knowledge_prompt_content = self.load_prompt_content(system_knowledge_file)
+        base_prompt_content = PromptFactory.load_prompt_content(system_base_file)
+        business_prompt_content = PromptFactory.load_prompt_content(system_business_file)
+        knowledge_prompt_content = PromptFactory.load_prompt_content(system_knowledge_file)
 
         # Combine the prompt contents.
         full_prompt = "\n".join([
@@ -79,5 +91,10 @@ class PromptFactory:
         return full_prompt
 
 
+# Pre-bake the assembled prompt at import: the contents are static, so
+# agent construction returns the cached string without touching disk.
+_FULL_PROMPT = PromptFactory.get_agent_prompt()
+
+
 if __name__ == "__main__":
     print(PromptFactory().get_agent_prompt())
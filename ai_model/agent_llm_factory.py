@@ -4,6 +4,7 @@ the appropriate ChatCompletion service (Azure, Ollama, or OpenAI)
 based on a JSON configuration file.
 """
 
+import functools
 import json
 import os
 
@@ -22,12 +23,14 @@ class AgentLLMFactory:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def load_config():
         """
-        Loads the JSON configuration file.
+        Loads the JSON configuration file, indexed by model name.
+        The file is parsed once per process and the index reused afterwards.
 
         Returns:
-            list: A list of LLM configurations.
+            dict: A mapping of model name to its LLM configuration.
 
         Raises:
             FileNotFoundError: If the configuration file is not found.
@@ -36,37 +39,42 @@ class AgentLLMFactory:
         llm_config_file = credential_manager.get_key("LLM_CONFIG_FILE")
         try:
             with open(llm_config_file, "r", encoding="utf-8") as file:
-                return json.load(file)
+                config_list = json.load(file)
         except FileNotFoundError as exception:
             raise FileNotFoundError(f"Configuration file '{llm_config_file}' not found.") from exception
         except json.JSONDecodeError as exception:
             raise ValueError(f"Invalid JSON in configuration file: {exception}") from exception
 
+        return {name: config for entry in config_list for name, config in entry.items()}
+
     @staticmethod
     def get_llm_config(agent_llm_model):
         """
             Retrieves the configuration for a specified LLM model.
         """
 
-        config_list = AgentLLMFactory.load_config()
-
-        # Search for the LLM configuration in the JSON
-        for agent_llm_config in config_list:
-            if agent_llm_model in agent_llm_config:
-                agent_llm_model_configuration = agent_llm_config[agent_llm_model]
-                # log.debug(f"Configuration for agent '{agent_llm_model}' found in the configuration file.")
-                # log.debug(agent_llm_model_configuration)
-                agent_llm_model_configuration['api_key'] = credential_manager.get_key \
-                    (agent_llm_model_configuration['api_key'])
+        config_by_model = AgentLLMFactory.load_config()
 
-                return agent_llm_model_configuration
+        if agent_llm_model not in config_by_model:
+            raise Exception(f"Invalid llm model provided: {agent_llm_model}")
 
-        raise Exception(f"Invalid llm model provided: {agent_llm_model}")
+        agent_llm_model_configuration = config_by_model[agent_llm_model]
+        # log.debug(f"Configuration for agent '{agent_llm_model}' found in the configuration file.")
+        # log.debug(agent_llm_model_configuration)
+        # Return a copy so the cached entry is never mutated with the
+        # resolved secret.
+        return {
+            **agent_llm_model_configuration,
+            'api_key': credential_manager.get_key(agent_llm_model_configuration['api_key']),
+        }
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_chat_completion(agent_llm_model=credential_manager.get_key('AGENT_LLM_MODEL')):
         """
             Creates and returns a ChatCompletion service instance based on the LLM configuration.
+            Cached per model so repeated agent initializations share one
+            service instance (and its underlying HTTP client).
         """
         chat_completion = None
         llm_config = AgentLLMFactory.get_llm_config(agent_llm_model)
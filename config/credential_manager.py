@@ -7,7 +7,7 @@ from dotenv import load_dotenv
 # Load the environment variables from the specified file
 load_dotenv()
 
-keys = [
+keys = frozenset({
     'ENVIRONMENT',
     'AGENT_LLM_MODEL',
     'AZURE_GPT_4O_API_KEY',
@@ -18,32 +18,38 @@ keys = [
     'PLUGINS_CONFIG_FILE',
     'GEMINI_API_KEY',
     'OPENAI_API_KEY'
-]
+})
 
 KEYS_DICTIONARY = {}
 
+# The environment never changes during a process lifetime; read it once
+# instead of hitting os.environ on every get_key call.
+_ENVIRONMENT = os.getenv('ENVIRONMENT')
+
 
 def get_key(key: str) -> Union[str | None]:
     """
         Retrieves the value of a specified key from local environment variables or Azure Key Vault.
     """
+    # Fast path: validate_all_keys() at import fills KEYS_DICTIONARY, so
+    # after start-up this is a single dict lookup.
+    cached_value = KEYS_DICTIONARY.get(key)
+    if cached_value is not None:
+        return cached_value
+
     if key not in keys:
         raise ValueError(
             f'Key {key} is not registered in the list of credential manager keys. Register key to fetch its value')
 
-    if os.getenv('ENVIRONMENT') == 'local':
+    if _ENVIRONMENT == 'local':
         # Get key from local environment variable
-
-        if key in KEYS_DICTIONARY:
-            return KEYS_DICTIONARY[key]
-
         key_value = os.getenv(key)
         if key_value is None:
             raise ValueError(f'{key} environment variable is not set.')
         KEYS_DICTIONARY[key] = key_value
         return key_value
 
-    raise Exception(f"Environment '{os.getenv('ENVIRONMENT')}' is currently not supported by credentials manager")
+    raise Exception(f"Environment '{_ENVIRONMENT}' is currently not supported by credentials manager")
 
 
 def validate_all_keys() -> None:
@@ -3,20 +3,106 @@ Defines a FastAPI application to orchestrate group chat among AI agents using Se
 """
 
 import asyncio
+import logging
+
+# Trie-based multi-pattern matcher for the agent-name scan; the bytes
+# fallback below keeps environments without the C extension working.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from semantic_kernel.agents import GroupChatOrchestration, BooleanResult, StringResult, MessageResult
 from semantic_kernel.agents import GroupChatManager
 from semantic_kernel.contents import ChatMessageContent, ChatHistory
 from semantic_kernel.agents.runtime import InProcessRuntime
 from utils.logger import log
-from utils.metrics import log_token_usage
+from utils.metrics import extract_consumed_token_count
 
 from agent_verse.Triage_Agent.agent import TriageAgent
 from agent_verse.Retriever_Agent.agent import RetrieverAgent
 from agent_verse.Composer_Agent.agent import ComposerAgent
 
-GROUP_CHAT_ORCHESTRATION = None
+# Cached once per process: building the three agents is the expensive
+# part of setup. The orchestration itself is rebuilt per conversation
+# (see get_group_chat_orchestration).
+ALLOWED_AGENTS = None
 STARTING_AGENT = None
 TERMINATION_KEYWORD = None
+# Lowercased once when TERMINATION_KEYWORD is set, not per turn.
+TERMINATION_KEYWORD_LC = None
+
+# Guards first-time agent setup: without it, concurrent callers
+# (e.g. the HTTP worker pool) would each run the expensive agent inits.
+_INIT_LOCK = asyncio.Lock()
+
+# Cached Aho-Corasick automaton over lowercased agent names, rebuilt only
+# when the participant roster changes.
+_NAME_AUTOMATON = None
+_NAME_AUTOMATON_KEY = None
+
+# Cached {lowercased name: original name} map for the same roster, so the
+# per-turn scan never re-lowercases agent names.
+_LC_NAME_MAP = None
+_LC_NAME_MAP_KEY = None
+
+# Agent names are ASCII, so the membership test only needs an ASCII case
+# fold: bytes.translate with a 256-entry table plus bytes.__contains__
+# (a C-level memmem) skips the Unicode casing walk of str.lower() over
+# long assistant replies.
+_ASCII_LOWER_TABLE = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+_LC_NAME_BYTES = None
+_LC_NAME_BYTES_KEY = None
+
+
+def _get_lc_name_bytes(participant_descriptions: dict[str, str]) -> list[tuple[bytes, str]]:
+    """
+    Returns (ascii-folded name bytes, original name) pairs, cached per
+    participant roster.
+    """
+    global _LC_NAME_BYTES, _LC_NAME_BYTES_KEY
+
+    key = frozenset(participant_descriptions)
+    if key != _LC_NAME_BYTES_KEY:
+        _LC_NAME_BYTES = [
+            (name.encode("utf-8").translate(_ASCII_LOWER_TABLE), name)
+            for name in participant_descriptions
+        ]
+        _LC_NAME_BYTES_KEY = key
+    return _LC_NAME_BYTES
+
+
+def _get_lc_name_map(participant_descriptions: dict[str, str]) -> dict[str, str]:
+    """
+    Returns a mapping of lowercased agent name to original name, cached
+    per participant roster.
+    """
+    global _LC_NAME_MAP, _LC_NAME_MAP_KEY
+
+    key = frozenset(participant_descriptions)
+    if key != _LC_NAME_MAP_KEY:
+        _LC_NAME_MAP = {name.lower(): name for name in participant_descriptions}
+        _LC_NAME_MAP_KEY = key
+    return _LC_NAME_MAP
+
+
+def _get_name_automaton(participant_descriptions: dict[str, str]):
+    """
+    Returns an automaton mapping lowercased agent names to their original
+    names, so a message is scanned once regardless of roster size.
+    """
+    global _NAME_AUTOMATON, _NAME_AUTOMATON_KEY
+
+    key = frozenset(participant_descriptions)
+    if key != _NAME_AUTOMATON_KEY:
+        automaton = ahocorasick.Automaton()
+        for agent_name in participant_descriptions:
+            automaton.add_word(agent_name.lower(), agent_name)
+        automaton.make_automaton()
+        _NAME_AUTOMATON = automaton
+        _NAME_AUTOMATON_KEY = key
+    return _NAME_AUTOMATON
 
 
 class ProcessGroupChatManager(GroupChatManager):
@@ -36,27 +122,41 @@ class ProcessGroupChatManager(GroupChatManager):
         """
 
         if len(chat_history.messages) == 1:
-            for agent_name in participant_descriptions:
-                if agent_name.lower() == STARTING_AGENT.name.lower():
-                    print("=====================================================================")
-                    print(f"[🤖] AGENT SELECTED: {agent_name}")
-                    print("=====================================================================")
-                    return StringResult(result=agent_name, reason="Custom selection logic.")
+            agent_name = _get_lc_name_map(participant_descriptions).get(STARTING_AGENT.name.lower())
+            if agent_name is not None:
+                log.info("[🤖] AGENT SELECTED: %s", agent_name)
+                return StringResult(result=agent_name, reason="Custom selection logic.")
 
             raise Exception("Starting Agent is not part of the Group Chat. Please add the Starting Agent to the member agents")
 
         try:
-            last_message_content = chat_history.messages[-1].content.lower()
+            last_message_content = chat_history.messages[-1].content
         except Exception:
             log.debug("Empty response from agent")
             last_message_content = ""
 
-        for agent in participant_descriptions:
-            if agent.lower() in last_message_content.lower():
-                print("=====================================================================")
-                print(f"[🤖] AGENT SELECTED: {agent.upper()}")
-                print("=====================================================================")
-                return StringResult(result=agent, reason="Custom selection logic.")
+        selected_agent = None
+        if ahocorasick is not None:
+            # Single pass over the message, independent of roster size.
+            mentioned = {
+                agent
+                for _, agent in _get_name_automaton(participant_descriptions).iter(last_message_content.lower())
+            }
+            if mentioned:
+                # Same tie-break as the bytes fallback (and the original
+                # loop): first name in roster order, not first occurrence
+                # in the message.
+                selected_agent = next(name for name in participant_descriptions if name in mentioned)
+        else:
+            message_bytes = last_message_content.encode("utf-8", "ignore").translate(_ASCII_LOWER_TABLE)
+            for name_bytes, agent in _get_lc_name_bytes(participant_descriptions):
+                if name_bytes in message_bytes:
+                    selected_agent = agent
+                    break
+
+        if selected_agent is not None:
+            log.info("[🤖] AGENT SELECTED: %s", selected_agent.upper())
+            return StringResult(result=selected_agent, reason="Custom selection logic.")
 
         chat_history.messages[-1].content = chat_history.messages[-1].content + " Please mention the AGENT name which needs to execute the instruction."
         last_agent_name = chat_history.messages[-1].name
@@ -77,9 +177,12 @@ class ProcessGroupChatManager(GroupChatManager):
         Decides whether the multi-agent conversation should end.
         """
 
-        last_message_content = chat_history.messages[-1].content.lower()
+        last_message_content = chat_history.messages[-1].content
 
-        if TERMINATION_KEYWORD.lower() in last_message_content:
+        # Fast path: the keyword in its configured casing ("Done") hits
+        # without allocating a lowercased copy of the whole message.
+        if TERMINATION_KEYWORD in last_message_content \
+                or TERMINATION_KEYWORD_LC in last_message_content.lower():
             return BooleanResult(result=True, reason="Custom termination logic.")
 
         base_result = await super().should_terminate(chat_history)
@@ -93,9 +196,13 @@ class ProcessAgent:
     """
         Drives the execution of a group chat orchestration.
     """
-    total_tokens_consumed = 0
-    total_prompt_tokens_consumed = 0
-    total_completion_tokens_consumed = 0
+
+    def __init__(self):
+        # Per-instance counters: as class attributes, concurrent chats
+        # would read each other's totals through the shared class state.
+        self.total_tokens_consumed = 0
+        self.total_prompt_tokens_consumed = 0
+        self.total_completion_tokens_consumed = 0
 
     def agent_response_callback(self, response: ChatMessageContent) -> None:
         """
@@ -103,56 +210,90 @@ class ProcessAgent:
         """
 
         if response.content.strip() != "":
-            print("=====================================================================")
-            print(f"[AUTO-REPLY] [🤖] Agent Speaker: {response.name.upper()}")
-            print("=====================================================================")
-            print(f"\nAGENT RESPONSE [💬] : {response.content}\n")
-            print("=====================================================================")
-            current_prompt_tokens, current_completion_tokens, current_total_token_consumed = log_token_usage(response)
+            current_prompt_tokens, current_completion_tokens, current_total_token_consumed = \
+                extract_consumed_token_count(response)
             self.total_prompt_tokens_consumed += current_prompt_tokens
             self.total_completion_tokens_consumed += current_completion_tokens
             self.total_tokens_consumed += current_total_token_consumed
-            print("[💬] > [🪙] > [🔥] Total Input Tokens Consumed : " + str(self.total_prompt_tokens_consumed))
-            print("[💬] > [🪙] > [🔥] Total Completion Tokens Consumed : " + str(self.total_completion_tokens_consumed))
-            print("[💬] > [🪙] > [🔥] Total Tokens Consumed : " + str(self.total_tokens_consumed))
-            print("=====================================================================")
+            # One record per turn instead of eight separate stdout writes.
+            log.info(
+                "[AUTO-REPLY] [🤖] agent=%s [💬] response=%s",
+                response.name.upper(),
+                response.content,
+            )
+            # Per-turn usage is only interesting while debugging; the
+            # running totals are flushed once at end of conversation.
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "[🪙] prompt=%d completion=%d total=%d",
+                    current_prompt_tokens,
+                    current_completion_tokens,
+                    current_total_token_consumed,
+                )
+
+    def flush_totals(self) -> None:
+        """
+                Emits the accumulated token totals for the conversation.
+        """
+        log.info(
+            "[🪙] > [🔥] Totals: prompt=%d completion=%d total=%d",
+            self.total_prompt_tokens_consumed,
+            self.total_completion_tokens_consumed,
+            self.total_tokens_consumed,
+        )
 
     async def get_group_chat_orchestration(self):
         """
-            Initializes (if needed) and returns the shared GroupChatOrchestration instance.
+            Initializes the agents (once) and returns a fresh GroupChatOrchestration
+            for one conversation.
         """
         global STARTING_AGENT
         global TERMINATION_KEYWORD
-        global GROUP_CHAT_ORCHESTRATION
-
-        if not GROUP_CHAT_ORCHESTRATION:
-            intake_agent = await TriageAgent().get_agent()
-            retriever_agent = await RetrieverAgent().get_agent()
-            composer_agent = await ComposerAgent().get_agent()
-
-            STARTING_AGENT = intake_agent
-            TERMINATION_KEYWORD = "Done"
-
-            # Create list of allowed agents
-            allowed_agents = [intake_agent,retriever_agent,composer_agent]
-
-            GROUP_CHAT_ORCHESTRATION = GroupChatOrchestration(
-                members=allowed_agents,
-                manager=ProcessGroupChatManager(max_rounds=5),
-                agent_response_callback=self.agent_response_callback,
-            )
-
-        return GROUP_CHAT_ORCHESTRATION
+        global TERMINATION_KEYWORD_LC
+        global ALLOWED_AGENTS
+
+        if ALLOWED_AGENTS is None:
+            async with _INIT_LOCK:
+                # Double-checked: a concurrent caller may have finished
+                # the init while we waited on the lock.
+                if ALLOWED_AGENTS is None:
+                    # The three agents initialize independently (LLM service,
+                    # prompts, plugin connections), so build them concurrently.
+                    intake_agent, retriever_agent, composer_agent = await asyncio.gather(
+                        TriageAgent().get_agent(),
+                        RetrieverAgent().get_agent(),
+                        ComposerAgent().get_agent(),
+                    )
+
+                    STARTING_AGENT = intake_agent
+                    TERMINATION_KEYWORD = "Done"
+                    TERMINATION_KEYWORD_LC = TERMINATION_KEYWORD.lower()
+
+                    # Create list of allowed agents
+                    ALLOWED_AGENTS = [intake_agent,retriever_agent,composer_agent]
+
+        # The orchestration (and its manager) must not be a process-wide
+        # singleton: GroupChatManager.should_terminate increments
+        # current_round and never resets it, so a reused manager ends
+        # every later conversation on its first turn with "Maximum
+        # rounds reached". A fresh manager per conversation also binds
+        # the response callback to the ProcessAgent driving it.
+        return GroupChatOrchestration(
+            members=ALLOWED_AGENTS,
+            manager=ProcessGroupChatManager(max_rounds=5),
+            agent_response_callback=self.agent_response_callback,
+        )
 
     async def run(self):
         runtime = InProcessRuntime()
         runtime.start()
         try:
-            group_chat_orchestration = await self.get_group_chat_orchestration()
             log.info("Ready! Type your input, or 'exit' to quit, 'reset' to restart the conversation.")
 
             while True:
-                user_input = input("User > ").strip()
+                # Read stdin in a worker thread so agent tasks keep
+                # running while the prompt is open.
+                user_input = (await asyncio.to_thread(input, "User > ")).strip()
                 if not user_input:
                     continue
 
@@ -167,6 +308,11 @@ class ProcessAgent:
                     print("[Conversation has been reset]")
                     continue
 
+                # Fetched per conversation so each run gets its own
+                # manager and the response callback stays bound to this
+                # instance's counters.
+                group_chat_orchestration = await self.get_group_chat_orchestration()
+
                 orchestration_result = await group_chat_orchestration.invoke(
                     task=user_input,
                     runtime=runtime,
@@ -175,6 +321,7 @@ class ProcessAgent:
                 # ensure we await the result so any spawned tasks settle
                 await orchestration_result.get()
 
+                self.flush_totals()
                 log.info("Group Chat Over")
                 break
         finally:
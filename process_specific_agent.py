@@ -0,0 +1,96 @@
+"""
+FastAPI application that runs group chat orchestrations through an async
+worker queue, so HTTP callers are enqueued without blocking the event
+loop and multiple chats can be processed concurrently.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+from semantic_kernel.agents.runtime import InProcessRuntime
+
+from orchestration import ProcessAgent
+from utils.logger import log
+
+# Number of group chats processed concurrently per server process.
+WORKERS = 2
+
+
+class GroupChatInput(BaseModel):
+    """
+    Request payload for a group chat run.
+    """
+    task: str
+
+
+async def process_group_chat(task: str, runtime: InProcessRuntime) -> None:
+    """
+    Runs one group chat orchestration for the given task on the worker's
+    long-lived runtime.
+    """
+    process_agent = ProcessAgent()
+    group_chat_orchestration = await process_agent.get_group_chat_orchestration()
+    orchestration_result = await group_chat_orchestration.invoke(
+        task=task,
+        runtime=runtime,
+    )
+    await orchestration_result.get()
+    process_agent.flush_totals()
+    log.info("Group Chat Over")
+
+
+async def _worker(queue: asyncio.Queue) -> None:
+    """
+    Drains the request queue; one coroutine per concurrent chat slot.
+
+    Each worker owns one InProcessRuntime for its lifetime — runtime
+    construction bootstraps agent registries and channels, so paying it
+    per request added ~10ms+ of overhead per call.
+    """
+    runtime = InProcessRuntime()
+    runtime.start()
+    try:
+        while True:
+            task = await queue.get()
+            try:
+                await process_group_chat(task, runtime)
+            except Exception:
+                log.exception("Group chat failed for task: %s", task)
+            finally:
+                queue.task_done()
+    finally:
+        await runtime.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts the worker tasks on startup and cancels them on shutdown.
+    """
+    app.state.queue = asyncio.Queue()
+    workers = [asyncio.create_task(_worker(app.state.queue)) for _ in range(WORKERS)]
+    try:
+        yield
+    finally:
+        for worker in workers:
+            worker.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+@app.post("/process_run", status_code=202)
+async def process_run(group_chat_input: GroupChatInput):
+    """
+    Enqueues a group chat run and returns immediately with 202 Accepted.
+    """
+    await app.state.queue.put(group_chat_input.task)
+    return {"status": "queued"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=9001)
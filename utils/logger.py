@@ -1,4 +1,5 @@
 
+import functools
 import sys
 import os
 import logging
@@ -15,6 +16,14 @@ if hasattr(sys.stderr, "reconfigure"):
     sys.stderr.reconfigure(encoding='utf-8')
 
 
+# Resolved once at import: Path.resolve() stats the filesystem and the
+# filter runs for every log record.
+# The separator is part of the prefix so a sibling directory sharing
+# the root as a string prefix (e.g. /root/package2) never matches.
+_PROJECT_ROOT_PREFIX = str(Path(__file__).resolve().parents[1]) + os.sep
+_PROJECT_ROOT_PREFIX_LEN = len(_PROJECT_ROOT_PREFIX)
+
+
 class LogFilter(logging.Filter):
     """
     Log filter to shorten file path in logs relative to the project root.
@@ -22,17 +31,17 @@ class LogFilter(logging.Filter):
 
     def filter(self, record: logging.LogRecord) -> bool:
         file_path = record.pathname
-        try:
-            project_root_path = Path(__file__).resolve().parents[1]
-            record.pathname = os.path.relpath(file_path, project_root_path)
-        except Exception:
-            record.pathname = file_path
+        if file_path.startswith(_PROJECT_ROOT_PREFIX):
+            record.pathname = file_path[_PROJECT_ROOT_PREFIX_LEN:]
         return True
 
 
+@functools.lru_cache(maxsize=1)
 def get_logger() -> Logger:
     """
     Initializes and returns a logger instance with both console and rotating file handlers.
+    Cached so repeat callers (worker processes, tests) skip the
+    credential lookups and handler setup entirely.
     """
 
     logger = logging.getLogger('agent_logger')
@@ -62,7 +71,8 @@ def get_logger() -> Logger:
     log_file = credential_manager.get_key('LOGGING_FILE_NAME') or "application.log"
     log_path = os.path.join(log_dir, log_file)
 
-    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    if not os.path.isdir(log_dir):
+        os.makedirs(log_dir, exist_ok=True)
 
     file_handler = TimedRotatingFileHandler(
         log_path, when="midnight", interval=1, backupCount=30, encoding="utf-8"
@@ -7,24 +7,25 @@ from utils.logger import log
 
 def extract_consumed_token_count(result):
     """
-        Extracts token usage counts from a Agent response result.
+        Extracts (prompt, completion, total) token counts from a Agent response result.
     """
 
-    if result and hasattr(result, "metadata"):
-        usage_info = result.metadata['usage']
-        if hasattr(usage_info, "total_tokens"):
-            total_tokens = usage_info.total_tokens
-            return total_tokens
-
-        if hasattr(usage_info, "prompt_tokens") and hasattr(usage_info, "completion_tokens"):
-            total_tokens = usage_info.prompt_tokens + usage_info.completion_tokens
-            return usage_info.prompt_tokens, usage_info.completion_tokens, total_tokens
-
-        log.debug("The 'usage' object does not have a 'total_tokens' or 'prompt_tokens' or 'completion_tokens' attribute.")
-    else:
+    metadata = getattr(result, "metadata", None)
+    if not metadata:
         log.debug("The result list is empty or missing the 'usage' attribute.")
-
-    return 0
+        return 0, 0, 0
+
+    usage_info = metadata.get("usage") if isinstance(metadata, dict) else getattr(metadata, "usage", None)
+    if usage_info is None:
+        log.debug("The result metadata does not carry a 'usage' entry.")
+        return 0, 0, 0
+
+    prompt_tokens = getattr(usage_info, "prompt_tokens", 0)
+    completion_tokens = getattr(usage_info, "completion_tokens", 0)
+    total_tokens = getattr(usage_info, "total_tokens", None)
+    if total_tokens is None:
+        total_tokens = prompt_tokens + completion_tokens
+    return prompt_tokens, completion_tokens, total_tokens
 
 
 def log_token_usage(response):